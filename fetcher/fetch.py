@@ -54,6 +54,7 @@ from .file_io import (save_batch_info,
                       get_last_run_date,
                       write_last_run_date,
                       write_seq_as_fasta,
+                      flush_batches,
                       post_process_metadata,
                       clean_profiles_from_data)
 from .metadata_tools import (get_pubmed_info,
@@ -525,7 +526,7 @@ def soft_restart(id_list, MAX_NUM, SEARCH_TERM):
     Returns:
         list: Updated list of accession Numbers to process.
     """
-    prev_processed = load_processed_ids(logger)
+    prev_processed = load_processed_ids(logger, as_set=True)
     if len(prev_processed):
         print(f"Restarting softly with previously processed Profiles.")
 
@@ -628,7 +629,11 @@ def main():
 
     # execute fetching and writing process
     print(f"Fetching Profiles up to {MAX_NUM}")
-    process_profiles(id_list, BATCH_SIZE, FETCH_PARALLEL, NUM_WORKERS)
+    try:
+        process_profiles(id_list, BATCH_SIZE, FETCH_PARALLEL, NUM_WORKERS)
+    finally:
+        # write out batches held in memory, also if fetching was aborted
+        flush_batches(force=True, logger=logger)
     print("Finished fetching all Profiles.")
     print(f"Processed {len(id_list)} Profiles in {time.time() - start_time} seconds.")
 
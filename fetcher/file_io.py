@@ -21,7 +21,7 @@ Key Features:
 - Post-process metadata entries, including duplicate removal and version control.
 - Clean up outdated files.
 
-Dependencies: Biopython, Pandas.
+Dependencies: NumPy, Pandas.
 
 Usage:
 - Import functions as needed into other scripts for processing and file management.
@@ -31,14 +31,14 @@ Author: Noah Hurmer as part of the mitoTree Project.
 """
 
 
+import concurrent.futures
+import csv
 import os
 from email.generator import Generator
 
+import numpy as np
 import pandas as pd
 from datetime import date, datetime
-from Bio import SeqIO
-from Bio.Seq import Seq
-from Bio.SeqRecord import SeqRecord
 
 from .global_defaults import (CURRENT_PROCESSED_IDS_FILE,
                               METADATA_FILE,
@@ -48,7 +48,14 @@ from .global_defaults import (CURRENT_PROCESSED_IDS_FILE,
                               IDS_FILE,
                               PROCESSED_IDS_DIR,
                               DEBUG_DIR,
-                              TIMESTAMP)
+                              TIMESTAMP,
+                              IO_WORKERS,
+                              FLUSH_EVERY)
+
+
+# processed IDs of this run, including the carried over ones of the previous run.
+# loaded once on the first save, so batch saves only append the new IDs.
+_processed_cache = None
 
 
 def save_processed_ids(processed_ids, logger=None):
@@ -56,22 +63,52 @@ def save_processed_ids(processed_ids, logger=None):
     Save processed sequence IDs to a new processed IDs file,
     carrying over the processed IDs from the old file.
 
+    The old file is only read on the first call, after that the IDs are kept in memory
+    and only new ones are appended to the file.
+    The file is only used for lookups, so the IDs are not kept in any particular order.
+
     Args:
         processed_ids (list): List of sequence IDs to save.
         logger (logging.Logger, optional): Logger for logging progress. Defaults to None.
     """
+    global _processed_cache
     file_path = CURRENT_PROCESSED_IDS_FILE
-    old_processed_ids = load_processed_ids()
 
-    # combine old and new IDs and write them to file
-    # remove duplicates
-    all_processed_ids = list(dict.fromkeys(processed_ids + old_processed_ids))
+    if _processed_cache is None:
+        # carry over the previous IDs into the new file
+        _processed_cache = load_processed_ids(logger, as_set=True)
+        _processed_cache.discard("")
+        checkpoint_processed_ids(logger)
+
+    # the file is only used for lookups, so order does not matter here
+    new_ids = set(processed_ids).difference(_processed_cache)
+    _processed_cache.update(new_ids)
+
+    with open(file_path, 'a') as f:
+        for seq_id in sorted(new_ids):
+            f.write(f"{seq_id}\n")
+    if logger:
+        logger.info(f"Saved {len(new_ids)} new processed seq_ids to {file_path}. (Total of {len(_processed_cache)} processed IDs.)")
+
+
+def checkpoint_processed_ids(logger=None):
+    """
+    Rewrite the current processed IDs file with all processed IDs held in memory.
+    Batch saves keep the file in sync by appending, so apart from carrying over the previous
+    IDs on the first save, this is only needed to restore the file, f.e. after an append failed part way.
+
+    Args:
+        logger (logging.Logger, optional): Logger for logging progress. Defaults to None.
+    """
+    if _processed_cache is None:
+        return
 
+    file_path = CURRENT_PROCESSED_IDS_FILE
     with open(file_path, 'w') as f:
-        for seq_id in all_processed_ids:
+        for seq_id in sorted(_processed_cache):
             f.write(f"{seq_id}\n")
     if logger:
-        logger.info(f"Saved {len(all_processed_ids)} processed seq_ids to {file_path}. (Includes {len(old_processed_ids)} previously processed IDs.)")
+        logger.info(f"Checkpointed {len(_processed_cache)} processed seq_ids to {file_path}.")
 
 
 def find_latest_processed_ids_file(logger=None):
@@ -85,16 +122,17 @@ def find_latest_processed_ids_file(logger=None):
         str or None: Path to the most recent processed IDs file, or None if none exist.
     """
     try:
-        files = [
-            os.path.join(PROCESSED_IDS_DIR, file)
-            for file in os.listdir(PROCESSED_IDS_DIR)
-            if file.endswith(".txt")
-        ]
+        with os.scandir(PROCESSED_IDS_DIR) as it:
+            files = [
+                (entry.stat(follow_symlinks=False).st_ctime, entry.path)
+                for entry in it
+                if entry.name.endswith(".txt") and entry.is_file()
+            ]
         if not files:
             if logger:
                 logger.warning("No processed IDs file found for soft restart.")
             return None
-        latest_file = max(files, key=os.path.getctime)
+        latest_file = max(files)[1]
         if logger:
             logger.info(f"Using the most recent processed IDs file: {latest_file}")
         return latest_file
@@ -104,24 +142,27 @@ def find_latest_processed_ids_file(logger=None):
         return None
 
 
-def load_processed_ids(logger=None):
+def load_processed_ids(logger=None, as_set=False):
     """
     Load processed sequence IDs from the most recent processed IDs file.
 
     Args:
         logger (logging.Logger, optional): Logger for logging progress. Defaults to None.
+        as_set (bool, optional): Return the IDs as a set for fast lookups. Defaults to False.
 
     Returns:
-        list: List of processed sequence IDs.
+        list or set: Processed sequence IDs.
     """
     file_path = find_latest_processed_ids_file(logger)
     if file_path:
         with open(file_path, 'r') as f:
             processed_ids = [line.strip() for line in f]
+        if as_set:
+            processed_ids = set(processed_ids)
         if logger:
             logger.info(f"Loaded {len(processed_ids)} processed seq_ids from {file_path}.")
         return processed_ids
-    return []
+    return set() if as_set else []
 
 
 def filter_unprocessed_ids(id_list, processed_ids, logger=None):
@@ -130,23 +171,34 @@ def filter_unprocessed_ids(id_list, processed_ids, logger=None):
 
     Args:
         id_list (list): List of sequence IDs to process.
-        processed_ids (list): List of already processed sequence IDs.
+        processed_ids (list or set): Already processed sequence IDs.
         logger (logging.Logger, optional): Logger for logging progress. Defaults to None.
 
 
     Returns:
         list: List of unprocessed sequence IDs.
     """
-    unprocessed_ids = [seq_id for seq_id in id_list if seq_id not in processed_ids]
+    processed_set = processed_ids if isinstance(processed_ids, set) else set(processed_ids)
+    unprocessed_ids = [seq_id for seq_id in id_list if seq_id not in processed_set]
     if logger:
         logger.info(f"Filtered out {len(id_list) - len(unprocessed_ids)} already-processed IDs."
                     f" Remaining: {len(unprocessed_ids)}.")
     return unprocessed_ids
 
 
+# batches held in memory until they are written by `flush_batches`
+_pending_filtered = []
+_pending_metas = []
+_pending_processed = []
+_pending_batches = 0
+# set when a flush failed, after which no further flushes are attempted
+_flush_failed = False
+
+
 def save_batch_info(index, filtered_entries, removed, metas, logger=None):
     """
     Save batch information of fetched profiles.
+    Batches are held in memory and written to disk every `FLUSH_EVERY` batches.
 
     Args:
         index (int): Index of the current batch.
@@ -155,19 +207,63 @@ def save_batch_info(index, filtered_entries, removed, metas, logger=None):
         metas (list): Metadata for the processed sequences.
         logger (logging.Logger, optional): Logger for logging progress. Defaults to None.
     """
+    global _pending_batches
     print("Saving batch info.")
 
-    if filtered_entries:
-        update_local_versions(filtered_entries, logger)
-        save_metadata(metas, logger)
-    if removed:
-        save_removed_versions(removed, logger)
+    _pending_filtered.extend(filtered_entries)
+    _pending_metas.extend(metas)
+    save_removed_versions(removed, logger)
+    _pending_processed.extend([rem.get("accession") for rem in removed] + filtered_entries)
+    _pending_batches += 1
+
+    if flush_batches(logger=logger):
+        print(f"Progress saved after processing {index + 1} entries.")
+
+
+def flush_batches(force=False, logger=None):
+    """
+    Write the batches held in memory to the data files, once `FLUSH_EVERY` batches are pending.
+
+    Args:
+        force (bool, optional): Write pending batches regardless of their number. Defaults to False.
+        logger (logging.Logger, optional): Logger for logging progress. Defaults to None.
 
-    all_processed_ids = [rem.get("accession") for rem in removed] + filtered_entries
-    save_processed_ids(all_processed_ids)
+    Returns:
+        bool: True if pending batches were written, False otherwise.
+    """
+    global _pending_batches, _flush_failed
+    if _flush_failed:
+        # the data files may be partially written, don't write on top of them
+        if logger:
+            logger.warning("Skipping flush of pending batches, as a previous flush failed.")
+        return False
+    if not force and _pending_batches < FLUSH_EVERY:
+        return False
 
-    print(f"Progress saved after processing {index + 1} entries.")
+    # take the pending batches out before writing, so a failed write is never replayed
+    filtered_entries = _pending_filtered[:]
+    metas = _pending_metas[:]
+    processed_ids = _pending_processed[:]
+    _pending_filtered.clear()
+    _pending_metas.clear()
+    _pending_processed.clear()
+    _pending_batches = 0
 
+    try:
+        if filtered_entries:
+            update_local_versions(filtered_entries, logger)
+            save_metadata(metas, logger)
+        flush_removed_versions(logger)
+        # processed IDs last, so they never include profiles not yet written
+        if processed_ids:
+            save_processed_ids(processed_ids, logger)
+    except Exception:
+        _flush_failed = True
+        raise
+    finally:
+        if force:
+            close_dropped_rows_file()
+    return True
 
 
 def split_accession(accession):
@@ -181,27 +277,96 @@ def split_accession(accession):
         tuple: (accession_id, version) where version is an integer.
     """
     try:
-        accession_id, version = accession.split('.')
+        accession_id, version = accession.rsplit('.', 1)
         return accession_id, int(version)
     except ValueError:
         print(accession)
         raise ValueError(f"Invalid accession format: {accession}")
 
 
+def split_accessions(accessions):
+    """
+    Vectorized version of `split_accession` for a whole column of accessions.
+
+    Args:
+        accessions (pd.Series): Accession strings in the format 'ABC123456.1'.
+
+    Returns:
+        tuple: (accession_ids, versions) as Series, where versions are integers.
+    """
+    # the version is always the last segment
+    split = accessions.str.rsplit('.', n=1, expand=True).reindex(columns=[0, 1])
+    versions = pd.to_numeric(split[1], errors='coerce')
+
+    invalid = split[0].isna() | (split[0] == '') | versions.isna() | (versions % 1 != 0)
+    if invalid.any():
+        accession = accessions[invalid].iloc[0]
+        raise ValueError(f"Invalid accession format: {accession}")
+
+    return split[0], versions.astype(int)
+
+
+# whether a CSV file that rows are appended to already has its header, by path.
+# the file is only checked on first use, after that it is known to exist.
+_header_written = {}
+
+
+def _needs_header(file_path):
+    """
+    Check if a CSV file that rows are about to be appended to still needs its header.
+
+    Args:
+        file_path (str): Path to the CSV file.
+
+    Returns:
+        bool: True if the header has to be written, False otherwise.
+    """
+    if file_path not in _header_written:
+        _header_written[file_path] = os.path.exists(file_path)
+    return not _header_written[file_path]
+
+
 def save_metadata(new_metas, logger=None):
     """
     Save metadata to the metadata file.
+    Rows are appended with the csv module directly, bypassing the pandas CSV formatter.
 
     Args:
         new_metas (list or DataFrame): New metadata entries to save.
         logger (logging.Logger, optional): Logger for logging progress. Defaults to None.
     """
-    meta_df = pd.DataFrame(new_metas)
-    meta_df.to_csv(METADATA_FILE, mode='a', header=not os.path.exists(METADATA_FILE), index=False)
+    if isinstance(new_metas, pd.DataFrame):
+        new_metas = new_metas.to_dict(orient='records')
+    if not len(new_metas):
+        return
+
+    # columns in order of first appearance, same as building a DataFrame from the dicts
+    fieldnames = list(dict.fromkeys(key for meta in new_metas for key in meta))
+    write_header = _needs_header(METADATA_FILE)
+    with open(METADATA_FILE, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator=os.linesep)
+        if write_header:
+            writer.writeheader()
+        writer.writerows(new_metas)
+    _header_written[METADATA_FILE] = True
     if logger:
         logger.info(f"{len(new_metas)} metadata entries written to {METADATA_FILE}.")
 
 
+def _read_lines(file_path):
+    """
+    Read all lines of a file as bytes in one go.
+
+    Args:
+        file_path (str): Path to the file to read.
+
+    Returns:
+        list: List of lines as bytes, without line endings.
+    """
+    with open(file_path, 'rb') as f:
+        return f.read().splitlines()
+
+
 def load_local_versions(logger=None):
     """
     Load local versions of sequence IDs from the local versions file.
@@ -215,19 +380,31 @@ def load_local_versions(logger=None):
     if not os.path.exists(IDS_FILE):
         return {}
     local_versions = {}
-    with open(IDS_FILE, 'r') as f:
-        for line in f:
-            accession, version = line.strip().split('.')
-            local_versions[accession] = int(version)
+    for line in _read_lines(IDS_FILE):
+        line = line.strip()
+        if not line:
+            continue
+        accession, version = line.rsplit(b'.', 1)
+        local_versions[accession.decode()] = int(version)
     if logger:
         logger.info(f"Loaded {len(local_versions)} local non-filtered-out versions.")
     return local_versions
 
 
+# columns of the dropped rows debug file, rows leave the ones they do not have empty
+_DROPPED_ROWS_FIELDS = ["accession", "filter", "id", "version", "reason"]
+# up to this many rows are written with the cached csv writer instead of pandas
+_DROPPED_ROWS_CSV_MAX = 1024
+# file and csv writer for the dropped rows debug file, opened on first use and reused
+_dropped_rows_file = None
+_dropped_rows_writer = None
+
+
 def save_dropped_rows(dropped_df, reason, logger=None):
     """
     Saves dropped rows to a CSV in the debug directory, appending a 'reason' column.
     By default, it appends to a file named 'duplicates_debug.csv'.
+    Small amounts of rows are written with a csv writer kept open across calls, larger ones via pandas.
 
     If you prefer a timestamped approach, you can add:
        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
@@ -238,23 +415,45 @@ def save_dropped_rows(dropped_df, reason, logger=None):
         reason (str): Reason for dropping, e.g. "duplicate" or "update".
         logger (logging.Logger, optional): Logger for progress messages.
     """
+    global _dropped_rows_file, _dropped_rows_writer
     if dropped_df.empty:
         return
 
     debug_file = os.path.join(DEBUG_DIR, "duplicates_debug_" + TIMESTAMP + ".csv")
 
-    dropped_df = dropped_df.copy()
-    dropped_df["reason"] = reason
-
-    write_header = not os.path.exists(debug_file)
-    mode = 'a' if write_header is False else 'w'
-
-    dropped_df.to_csv(debug_file, mode=mode, header=write_header, index=False)
+    dropped_df = dropped_df.assign(reason=reason)
+
+    if len(dropped_df) < _DROPPED_ROWS_CSV_MAX:
+        if _dropped_rows_writer is None:
+            write_header = _needs_header(debug_file)
+            _dropped_rows_file = open(debug_file, 'a', newline='')
+            _dropped_rows_writer = csv.DictWriter(_dropped_rows_file, fieldnames=_DROPPED_ROWS_FIELDS,
+                                                  extrasaction='ignore', lineterminator=os.linesep)
+            if write_header:
+                _dropped_rows_writer.writeheader()
+        _dropped_rows_writer.writerows(dropped_df.to_dict(orient='records'))
+        _dropped_rows_file.flush()
+    else:
+        # header is written exactly once, by whichever path creates the file
+        write_header = _needs_header(debug_file)
+        dropped_df.reindex(columns=_DROPPED_ROWS_FIELDS).to_csv(debug_file, mode='a', header=write_header, index=False)
+    _header_written[debug_file] = True
 
     if logger:
         logger.info(f"Appended {len(dropped_df)} dropped rows to {debug_file} with reason '{reason}'.")
 
 
+def close_dropped_rows_file():
+    """
+    Close the dropped rows debug file, if it was opened by `save_dropped_rows`.
+    """
+    global _dropped_rows_file, _dropped_rows_writer
+    if _dropped_rows_file is not None:
+        _dropped_rows_file.close()
+    _dropped_rows_file = None
+    _dropped_rows_writer = None
+
+
 def duplicate_removal(entries, logger=None):
     """
     Remove duplicate entries based on accession and version.
@@ -277,7 +476,7 @@ def duplicate_removal(entries, logger=None):
             logger.warning(f"{len(df_duplicates)} duplicate entries dropped from entries.")
 
     # remove older version of same accession
-    entries[["id", "version"]] = entries['accession'].apply(lambda x: pd.Series(split_accession(x)))
+    entries["id"], entries["version"] = split_accessions(entries['accession'])
     idx_to_keep = entries.groupby("id")["version"].idxmax()
     df_older = entries.loc[~entries.index.isin(idx_to_keep)].copy()
     if not df_older.empty:
@@ -310,6 +509,16 @@ def update_local_versions(entries, logger=None):
     if not len(ex_ids) and not len(entries):
         return
 
+    # common case: no entry shares an accession ID with any other, so there is nothing to dedupe
+    ex_roots = {acc.rsplit('.', 1)[0] for acc in ex_ids}
+    new_roots = {acc.rsplit('.', 1)[0] for acc in entries}
+    if len(new_roots) == len(entries) and ex_roots.isdisjoint(new_roots):
+        with open(IDS_FILE, 'a') as f:
+            f.writelines(f"{acc}\n" for acc in entries)
+        if logger:
+            logger.info(f"Appended {len(entries)} new versions to {IDS_FILE}.")
+        return
+
     ids = ex_ids + list(entries)
 
     ids_df = duplicate_removal(pd.DataFrame(ids, columns=["accession"]), logger=logger)
@@ -332,20 +541,25 @@ def load_removed_versions(logger=None):
     if not os.path.exists(REMOVED_IDS_FILE):
         return []
     local_removed = {}
-    with open(REMOVED_IDS_FILE, 'r') as f:
-        next(f)
-        for line in f:
-            accession_num, _ = line.strip().split(',')
-            accession, version = accession_num.strip().split('.')
-            local_removed[accession] = int(version)
+    # skip the header
+    for line in _read_lines(REMOVED_IDS_FILE)[1:]:
+        accession_num, _ = line.strip().split(b',')
+        accession, version = accession_num.strip().rsplit(b'.', 1)
+        local_removed[accession.decode()] = int(version)
     if logger:
         logger.info(f"Loaded {len(local_removed)} local removed versions.")
     return local_removed
 
 
+# removed entries not yet written to the removed ids file.
+# they are deduplicated and written once by `flush_removed_versions`.
+_removed_cache = []
+
+
 def save_removed_versions(removed_entries, logger=None):
     """
-    Save removed sequences to the removed ids file.
+    Queue removed sequences to be saved to the removed ids file.
+    The entries are only written to disk by `flush_removed_versions`.
 
     Args:
         removed_entries (list): List of removed entries with accession and filter reason.
@@ -354,7 +568,24 @@ def save_removed_versions(removed_entries, logger=None):
     if not len(removed_entries):
         return
 
-    removed_entries = pd.DataFrame(removed_entries, columns=['accession', 'filter'])
+    _removed_cache.extend(removed_entries)
+    if logger:
+        logger.info(f"Queued {len(removed_entries)} entries for {REMOVED_IDS_FILE}.")
+
+
+def flush_removed_versions(logger=None):
+    """
+    Write all queued removed sequences to the removed ids file, removing duplicates and older versions.
+
+    Args:
+        logger (logging.Logger, optional): Logger for logging progress. Defaults to None.
+    """
+    if not len(_removed_cache):
+        return
+
+    # take the entries out before writing, so a failed write is never replayed
+    removed_entries = pd.DataFrame(_removed_cache, columns=['accession', 'filter'])
+    _removed_cache.clear()
     if os.path.exists(REMOVED_IDS_FILE):
         prev_removed = pd.read_csv(REMOVED_IDS_FILE)
     else:
@@ -381,18 +612,19 @@ def cleanup_old_files(directory, keep_last=3, logger=None):
     try:
         print(f"Cleaning up files in {directory}.")
         extensions = [".txt", ".csv", ".log"]
-        files = [
-            os.path.join(directory, file)
-            for file in os.listdir(directory) if file.endswith(tuple(extensions))
-        ]
+        with os.scandir(directory) as it:
+            files = [
+                (entry.stat(follow_symlinks=False).st_ctime, entry.path)
+                for entry in it if entry.name.endswith(tuple(extensions)) and entry.is_file()
+            ]
         if len(files) <= keep_last:
             if logger:
                 logger.info(f"No cleanup needed for {directory}. Found {len(files)} files.")
             return
 
         # Sort files by their modification time, keeping the last `keep_last`
-        files.sort(key=os.path.getctime, reverse=True)
-        files_to_remove = files[keep_last:]
+        files.sort(reverse=True)
+        files_to_remove = [file for _, file in files[keep_last:]]
 
         # Remove old files
         for file in files_to_remove:
@@ -420,19 +652,10 @@ def write_seq_as_fasta(record, logger=None):
         bool: True if the operation was successful, False otherwise.
     """
     try:
-        # this is a bit annoying,but in order to actually manipulate the sequence,
-        # the record needs to be remade.
-        # alternative would be to read the file lines as strings, not sure if thats better
-        cleaned_sequence = clean_sequence(record.seq)
-
-        cleaned_record = SeqRecord(
-            Seq(cleaned_sequence),
-            id=record.id,
-            name=record.name,
-            description=record.description
-        )
-
-        SeqIO.write(cleaned_record, f"{SEQS_DIR}/{record.id.split('.')[0]}.fasta", "fasta")
+        # format first and write the whole file in one call
+        fasta = format_fasta(record)
+        with open(f"{SEQS_DIR}/{record.id.split('.')[0]}.fasta", 'w') as f:
+            f.write(fasta)
 
         if logger:
             logger.debug(f"FASTA for {record.id} written.")
@@ -446,10 +669,42 @@ def write_seq_as_fasta(record, logger=None):
         return False
 
 
+def format_fasta(record):
+    """
+    Formats a record as FASTA text with a cleaned sequence, wrapped to lines of 60 characters.
+
+    Args:
+        record (SeqRecord): A Biopython SeqRecord containing the sequence data.
+
+    Returns:
+        str: The FASTA text of the record.
+    """
+    cleaned_sequence = clean_sequence(record.seq)
+
+    # same header as Biopython's fasta writer: id, followed by the description
+    # unless the description already starts with the id
+    header = record.id
+    if record.description:
+        description = record.description.replace("\n", " ")
+        if description.split(None, 1)[:1] == [record.id]:
+            header = description
+        else:
+            header = f"{record.id} {description}"
+
+    lines = [f">{header}"]
+    lines.extend(cleaned_sequence[i:i + 60] for i in range(0, len(cleaned_sequence), 60))
+    lines.append("")
+    return "\n".join(lines)
+
+
+# substitution rules applied to sequences by `clean_sequence`
+_CLEAN_TABLE = str.maketrans({'D': '-'})
+
+
 def clean_sequence(sequence):
     """
     Clean a sequence string by defined rules.
-    Currently just replacing all occurrences of 'D' with '-'.
+    Rules are defined in `_CLEAN_TABLE`, currently just replacing all occurrences of 'D' with '-'.
 
     Args:
         sequence (str): The sequence string to clean.
@@ -457,7 +712,7 @@ def clean_sequence(sequence):
     Returns:
         str: Cleaned sequence string.
     """
-    return str(sequence).replace('D', '-')
+    return (sequence if isinstance(sequence, str) else str(sequence)).translate(_CLEAN_TABLE)
 
 
 def get_last_run_date(file_path=LAST_RUN_PATH, logger=None):
@@ -549,7 +804,8 @@ def post_process_metadata(logger=None):
             logger.error(f"Metadata file '{METADATA_FILE}' not found.")
         return
 
-    meta_df = pd.read_csv(METADATA_FILE)
+    # read as strings, skipping type inference and keeping values as written (f.e. no float pubmed ids)
+    meta_df = pd.read_csv(METADATA_FILE, dtype=str)
     if logger:
         logger.info(f"Loaded {len(meta_df) - 1} rows from metadata file.")
 
@@ -559,44 +815,37 @@ def post_process_metadata(logger=None):
 
     # add helper columns
     meta_df['index'] = meta_df.index # order of fetched
-    meta_df[['id', 'version']] = meta_df['accession'].apply(lambda x: pd.Series(split_accession(x)))
+    meta_df['id'], meta_df['version'] = split_accessions(meta_df['accession'])
 
-    meta_df = meta_df.sort_values(by=['id', 'version', 'index'], ascending=[True, False, True])
+    meta_df = meta_df.sort_values(by=['id', 'version', 'index'], ascending=[True, False, False])
 
-    # keep the highest version per group
-    rows_to_keep = []
-    for _, group in meta_df.groupby('id'):
-        # highest version row
-        best_row = group.iloc[0]
+    # keep the highest version per ID, splitting up any tied highest versions by most recently added
+    kept = ~meta_df.duplicated(subset='id', keep='first')
+
+    if logger:
         # check if highest version is the most recent
-        if best_row['index'] != group['index'].max():
-            if logger:
-                logger.warning(f"Highest version for ID {best_row['id']} ({best_row['accession']}) "
-                               f"is not the most recently added row.\n"
-                               f"Other versions present:\n"
-                               f"Index  -  Accession\n"
-                               f"{group['accession']}\n"
-                               f"Keeping highest version anyway.")
+        not_recent = kept & (meta_df['index'] != meta_df.groupby('id')['index'].transform('max'))
+        if not_recent.any():
+            logger.warning(f"Highest version is not the most recently added row for {not_recent.sum()} IDs:\n"
+                           f"{meta_df.loc[not_recent, ['index', 'accession']].to_string(index=False)}\n"
+                           f"Keeping highest version anyway.")
 
         # check highest version row has the most filled fields
-        for _, row in group.iloc[1:].iterrows():
-            if row.notna().sum() > best_row.notna().sum():
-                if logger:
-                    logger.warning(f"Row {row['index']} with ID {row['id']} and version {row['version']} "
-                                   f"has more filled fields than the highest version"
-                                   f" ({best_row['accession']} @ row {best_row['index']}).")
-
-        # split up any tied highest versions (same ID, same version) by most recently added
-        max_version_rows = group[group['version'] == best_row['version']]
-        best_rows = max_version_rows.loc[max_version_rows['index'] == max_version_rows['index'].max()]
-        rows_to_keep.append(best_rows)
-
-    final_df = pd.concat(rows_to_keep).drop(columns=['id', 'version', 'index']).reset_index(drop=True)
+        # rows are sorted by id with the kept row first, so carrying the kept row's position forward
+        # gives every row the position of its ID's kept row
+        filled = meta_df.notna().to_numpy().sum(axis=1)
+        kept_pos = np.maximum.accumulate(np.where(kept.to_numpy(), np.arange(len(meta_df)), 0))
+        more_filled = filled > filled[kept_pos]
+        if more_filled.any():
+            logger.warning(f"{more_filled.sum()} rows have more filled fields than the highest version of their ID:\n"
+                           f"{meta_df.loc[more_filled, ['index', 'id', 'version', 'accession']].to_string(index=False)}")
+
+    final_df = meta_df.loc[kept].drop(columns=['id', 'version', 'index']).reset_index(drop=True)
     if logger:
         logger.info(f"Removed {len(meta_df) - len(final_df)} duplicate rows.")
 
     # the removed rows
-    removed_df = pd.concat([meta_df.drop(columns=['id', 'version', 'index']), final_df]).drop_duplicates(keep=False)
+    removed_df = meta_df.loc[~kept].drop(columns=['id', 'version', 'index']).reset_index(drop=True)
 
     # save cleaned metadata
     final_df.to_csv(METADATA_FILE, index=False)
@@ -665,7 +914,7 @@ def clean_profiles_from_data(ids_list, logger=None):
     # REMOVED_IDS_FILE
     if os.path.exists(REMOVED_IDS_FILE):
         try:
-            df_removed = pd.read_csv(REMOVED_IDS_FILE)
+            df_removed = pd.read_csv(REMOVED_IDS_FILE, dtype=str, na_filter=False)
             before_count = len(df_removed)
             df_removed = df_removed[df_removed["accession"].isin(keep_set)]
             after_count = len(df_removed)
@@ -691,7 +940,8 @@ def clean_profiles_from_data(ids_list, logger=None):
     # METADATA_FILE
     if os.path.exists(METADATA_FILE):
         try:
-            df_meta = pd.read_csv(METADATA_FILE)
+            # only filtering rows here, so read everything as plain strings to write it back unchanged
+            df_meta = pd.read_csv(METADATA_FILE, dtype=str, na_filter=False)
             if "accession" in df_meta.columns:
                 before_count = len(df_meta)
                 df_meta = df_meta[df_meta["accession"].isin(keep_set)]
@@ -725,25 +975,31 @@ def clean_profiles_from_data(ids_list, logger=None):
         try:
             valid_roots = set(acc.split(".")[0] for acc in keep_set)
 
-            all_files = os.listdir(SEQS_DIR)
-            fasta_files = [f for f in all_files if f.lower().endswith(".fasta")]
-
-            removed_count = 0
-            for fasta_name in fasta_files:
-                root_name = os.path.splitext(fasta_name)[0]
-                if root_name not in valid_roots:
-                    # remove
-                    full_path = os.path.join(SEQS_DIR, fasta_name)
-                    try:
-                        os.remove(full_path)
-                        removed_count += 1
-                        if logger:
-                            logger.debug(f"Removed FASTA file not in keep list: {full_path}")
-                    except Exception as e:
-                        if logger:
-                            logger.error(f"Error removing {full_path}: {e}")
-                        else:
-                            print(f"Error removing {full_path}: {e}")
+            with os.scandir(SEQS_DIR) as it:
+                to_remove = [
+                    entry.path for entry in it
+                    if entry.is_file()
+                    and entry.name.lower().endswith(".fasta")
+                    and os.path.splitext(entry.name)[0] not in valid_roots
+                ]
+
+            def remove_fasta(full_path):
+                try:
+                    os.remove(full_path)
+                    if logger:
+                        logger.debug(f"Removed FASTA file not in keep list: {full_path}")
+                    return True
+                except Exception as e:
+                    if logger:
+                        logger.error(f"Error removing {full_path}: {e}")
+                    else:
+                        print(f"Error removing {full_path}: {e}")
+                    return False
+
+            # unlinking is syscall bound, so removing in threads hides the latency
+            with concurrent.futures.ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+                removed_count = sum(executor.map(remove_fasta, to_remove))
+
             if logger and removed_count > 0:
                 logger.info(
                     f"Removed {removed_count} FASTA files from {SEQS_DIR} "
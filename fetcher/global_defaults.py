@@ -53,10 +53,15 @@ SEARCH_TERM = "mitochondrion[filter] AND Homo Sapiens[Organism] AND 16500:999999
 # this speeds up the fetching by a lot as the Entrez response can be rather slow
 FETCH_PARALLEL = False
 NUM_WORKERS = 16
+# number of threads for file operations on many small files, f.e. removing FASTA files
+IO_WORKERS = 16
 # how many profiles to fetch
 MAX_NUM = 500
 # batch size to save them in
 BATCH_SIZE = 100
+# number of batches to hold in memory before writing them to the data files
+# (pending batches are always written at the end of a run)
+FLUSH_EVERY = 5
 # LIMIT_NUM is set to return all search results
 #   (used to constrain the max value for soft restarting
 #   and for the post-process check to check if any profiles were not downloaded correctly)